@@ -3,12 +3,34 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Iterator, Sequence, Set
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Sequence, Set, TypeVar
 
 import pygame
 
 TILE_SIZE = 16
 
+SURFACE_NONE = 0
+SURFACE_GROUND = 1
+SURFACE_PLATFORM = 2
+
+_T = TypeVar("_T")
+
+
+def _iter_shuffled(rng: random.Random, items: Sequence[_T]) -> Iterator[_T]:
+    """Yield ``items`` in uniformly random order, drawing lazily.
+
+    This is a Fisher-Yates shuffle run one step per yielded item, so callers that
+    stop early only pay for the elements they actually consumed. Instead of copying
+    ``items``, the indices moved by earlier swaps are kept in a sparse mapping.
+    """
+
+    swapped: Dict[int, int] = {}
+    for end in range(len(items) - 1, -1, -1):
+        pick = rng.randrange(end + 1)
+        yield items[swapped.get(pick, pick)]
+        swapped[pick] = swapped.pop(end, end)
+
 
 @dataclass(frozen=True)
 class Tile:
@@ -17,12 +39,14 @@ class Tile:
     x: int
     y: int
 
-    @property
+    @cached_property
     def rect(self) -> pygame.Rect:
+        """Pixel-space bounds, built once per tile and shared; treat as read-only."""
+
         return pygame.Rect(self.x * TILE_SIZE, self.y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hazard:
     """Simple rectangular hazard (such as spikes)."""
 
@@ -37,7 +61,7 @@ class Hazard:
         return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpawnPoint:
     """Spawn location for collectibles or power-ups."""
 
@@ -58,11 +82,20 @@ class Level:
     platform_attempts: int = 75
     seed: int | None = None
     random: random.Random = field(init=False, repr=False)
-    _tiles: Set[Tile] = field(init=False, default_factory=set, repr=False)
-    _surface_tiles: Set[Tile] = field(init=False, default_factory=set, repr=False)
-    _ground_surface_tiles: Set[Tile] = field(init=False, default_factory=set, repr=False)
-    _platform_surface_tiles: Set[Tile] = field(init=False, default_factory=set, repr=False)
+    # Row-major occupancy grid: one byte per cell, non-zero when solid.
+    _solid: bytearray = field(init=False, default_factory=bytearray, repr=False)
+    # Row-major Tile instances for solid cells, reused so their rects stay cached.
+    _tile_grid: List[Optional[Tile]] = field(init=False, default_factory=list, repr=False)
+    # Row-major surface classification using the SURFACE_* constants.
+    _surface: bytearray = field(init=False, default_factory=bytearray, repr=False)
+    _surface_tiles: List[Tile] = field(init=False, default_factory=list, repr=False)
+    _ground_surface_tiles: List[Tile] = field(init=False, default_factory=list, repr=False)
+    _platform_surface_tiles: List[Tile] = field(init=False, default_factory=list, repr=False)
+    # Highest ground-surface row for every column that has one.
+    _ground_top_by_column: Dict[int, int] = field(init=False, default_factory=dict, repr=False)
     hazards: list[Hazard] = field(init=False, default_factory=list)
+    _hazards_by_column: Dict[int, List[Hazard]] = field(init=False, default_factory=dict, repr=False)
+    _hazard_rects_by_column: Dict[int, List[pygame.Rect]] = field(init=False, default_factory=dict, repr=False)
     collectible_spawns: list[SpawnPoint] = field(init=False, default_factory=list)
     powerup_spawns: list[SpawnPoint] = field(init=False, default_factory=list)
     goal_rect: pygame.Rect = field(init=False)
@@ -73,63 +106,124 @@ class Level:
         self.random = random.Random(self.seed)
         self._generate()
 
+    def _set_solid(self, x: int, y: int) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._solid[y * self.width + x] = 1
+
+    def _fill_column(self, x: int, top: int) -> None:
+        """Mark every cell of column ``x`` from row ``top`` down as solid."""
+
+        top = max(0, top)
+        if 0 <= x < self.width and top < self.height:
+            self._solid[top * self.width + x :: self.width] = b"\x01" * (self.height - top)
+
+    def _fill_row(self, x: int, y: int, length: int) -> None:
+        """Mark ``length`` cells of row ``y`` starting at column ``x`` as solid."""
+
+        start = max(0, x)
+        end = min(self.width, x + length)
+        if 0 <= y < self.height and start < end:
+            row = y * self.width
+            self._solid[row + start : row + end] = b"\x01" * (end - start)
+
     def _generate(self) -> None:
-        self._tiles.clear()
+        self._solid = bytearray(self.width * self.height)
+
+        # Random values are drawn in per-stage batches with ``choices`` rather
+        # than one ``randint``/``choice`` call at a time.
+        rng = self.random
 
         # Generate a rolling ground that varies slightly per column.
-        previous_ground_depth = self.base_ground_height
-        for x in range(self.width):
-            if x == 0:
-                ground_depth = previous_ground_depth
-            else:
-                change = self.random.randint(-1, 1)
-                occasional_hill = 1 if self.random.random() < 0.05 else 0
-                ground_depth = max(
-                    3,
-                    min(self.height // 2, previous_ground_depth + change + occasional_hill),
-                )
-            previous_ground_depth = ground_depth
-            for y in range(self.height - ground_depth, self.height):
-                self._tiles.add(Tile(x, y))
+        changes = rng.choices((-1, 0, 1), k=self.width - 1)
+        hills = rng.choices((0, 1), cum_weights=(0.95, 1.0), k=self.width - 1)
+        ground_depth = self.base_ground_height
+        self._fill_column(0, self.height - ground_depth)
+        for x, change, occasional_hill in zip(range(1, self.width), changes, hills):
+            ground_depth = max(
+                3,
+                min(self.height // 2, ground_depth + change + occasional_hill),
+            )
+            self._fill_column(x, self.height - ground_depth)
 
         # Scatter floating platforms across the level.
-        for _ in range(self.platform_attempts):
-            platform_width = self.random.randint(3, 7)
-            x = self.random.randint(0, max(0, self.width - platform_width - 1))
-            y = self.random.randint(3, max(3, self.height - self.base_ground_height - 6))
-            vertical_noise = self.random.choice([-1, 0, 0, 1])
+        attempts = self.platform_attempts
+        widths = rng.choices(range(3, 8), k=attempts)
+        rows = rng.choices(range(3, max(3, self.height - self.base_ground_height - 6) + 1), k=attempts)
+        noise = rng.choices((-1, 0, 0, 1), k=attempts)
+        for platform_width, y, vertical_noise in zip(widths, rows, noise):
+            x = int(rng.random() * (max(0, self.width - platform_width - 1) + 1))
             y = max(2, min(self.height - 6, y + vertical_noise))
-            for offset in range(platform_width):
-                self._tiles.add(Tile(x + offset, y))
-                # Add some decorative support tiles.
-                if self.random.random() < 0.18:
-                    self._tiles.add(Tile(x + offset, y + 1))
-
+            self._fill_row(x, y, platform_width)
+            # Add some decorative support tiles.
+            supports = rng.choices((False, True), cum_weights=(0.82, 1.0), k=platform_width)
+            for offset, supported in enumerate(supports):
+                if supported:
+                    self._set_solid(x + offset, y + 1)
+
+        width = self.width
+        self._tile_grid = [
+            Tile(index % width, index // width) if solid else None
+            for index, solid in enumerate(self._solid)
+        ]
         self._build_surface_cache()
         self._generate_hazards_and_pickups()
         self._build_goal_rect()
 
     def _build_surface_cache(self) -> None:
-        self._surface_tiles.clear()
-        self._ground_surface_tiles.clear()
-        self._platform_surface_tiles.clear()
-        for tile in self._tiles:
-            above = Tile(tile.x, tile.y - 1)
-            if above not in self._tiles:
-                self._surface_tiles.add(tile)
-                below = Tile(tile.x, tile.y + 1)
-                if below in self._tiles:
-                    self._ground_surface_tiles.add(tile)
+        # Each grid row is one cell per byte holding 0 or 1, so packing a row
+        # into an int lets neighbour tests run as whole-row bitwise operations.
+        width = self.width
+        solid = self._solid
+        ones = int.from_bytes(b"\x01" * width, "big")
+        rows = [
+            int.from_bytes(solid[y * width : (y + 1) * width], "big")
+            for y in range(self.height)
+        ]
+        surface = bytearray()
+        self._surface_tiles = []
+        self._ground_surface_tiles = []
+        self._platform_surface_tiles = []
+        self._ground_top_by_column = {}
+        for y, row in enumerate(rows):
+            above = rows[y - 1] if y > 0 else 0
+            below = rows[y + 1] if y + 1 < self.height else 0
+            exposed = row & (above ^ ones)
+            ground = exposed & below
+            platform = exposed ^ ground
+            kinds = (ground * SURFACE_GROUND + platform * SURFACE_PLATFORM).to_bytes(width, "big")
+            surface += kinds
+            if not exposed:
+                continue
+            cells = exposed.to_bytes(width, "big")
+            x = cells.find(1)
+            while x != -1:
+                tile = self._tile_grid[y * width + x]
+                self._surface_tiles.append(tile)
+                if kinds[x] == SURFACE_GROUND:
+                    self._ground_surface_tiles.append(tile)
+                    # Rows are scanned top-down, so the first hit is the highest.
+                    self._ground_top_by_column.setdefault(x, y)
                 else:
-                    self._platform_surface_tiles.add(tile)
+                    self._platform_surface_tiles.append(tile)
+                x = cells.find(1, x + 1)
+        self._surface = surface
 
     def _generate_hazards_and_pickups(self) -> None:
         self.hazards = []
+        self._hazards_by_column = {}
+        self._hazard_rects_by_column = {}
         self.collectible_spawns = []
         self.powerup_spawns = []
 
-        # Generate spikes on exposed ground.
+        # Generate spikes on exposed ground. Each spike sits inside a single
+        # tile cell, so remembering those cells makes overlap checks exact.
+        # Power-up candidates are gathered in the same pass: they appear more
+        # rarely and only on ground columns with some spacing.
+        hazard_cells: Set[int] = set()
+        powerup_candidates: List[Tile] = []
         for tile in self._ground_surface_tiles:
+            if tile.x % 9 in (2, 5, 7):
+                powerup_candidates.append(tile)
             if tile.y <= 1:
                 continue
             if self.random.random() < 0.065:
@@ -137,36 +231,33 @@ class Level:
                 spike_y = tile.y * TILE_SIZE + TILE_SIZE - spike_height
                 hazard = Hazard(tile.x * TILE_SIZE, spike_y, TILE_SIZE, spike_height)
                 self.hazards.append(hazard)
+                self._hazards_by_column.setdefault(tile.x, []).append(hazard)
+                self._hazard_rects_by_column.setdefault(tile.x, []).append(hazard.rect)
+                hazard_cells.add(tile.y * self.width + tile.x)
 
         # Choose candidate positions for collectibles and power-ups.
-        all_surfaces = list(self._surface_tiles)
-        self.random.shuffle(all_surfaces)
-
-        used_columns: Set[int] = set()
+        used_columns = bytearray(self.width)
         collectible_budget = max(12, self.width // 4)
-        for tile in all_surfaces:
+        for tile in _iter_shuffled(self.random, self._surface_tiles):
             if len(self.collectible_spawns) >= collectible_budget:
                 break
-            if tile.x in used_columns:
+            if used_columns[tile.x]:
                 continue
-            if any(h.rect.colliderect(pygame.Rect(tile.x * TILE_SIZE, tile.y * TILE_SIZE, TILE_SIZE, TILE_SIZE)) for h in self.hazards):
+            if tile.y * self.width + tile.x in hazard_cells:
                 continue
-            used_columns.add(tile.x)
+            used_columns[tile.x] = 1
             spawn_y = tile.y * TILE_SIZE - TILE_SIZE * 0.35
             self.collectible_spawns.append(
                 SpawnPoint(tile.x * TILE_SIZE + TILE_SIZE / 2, spawn_y)
             )
 
-        # Power-ups appear more rarely and only on ground columns with some spacing.
-        powerup_candidates = [tile for tile in self._ground_surface_tiles if tile.x % 9 in (2, 5, 7)]
-        self.random.shuffle(powerup_candidates)
         powerup_target = min(6, max(2, self.width // 45))
-        for tile in powerup_candidates:
+        for tile in _iter_shuffled(self.random, powerup_candidates):
             if len(self.powerup_spawns) >= powerup_target:
                 break
-            if tile.x in used_columns:
+            if used_columns[tile.x]:
                 continue
-            used_columns.add(tile.x)
+            used_columns[tile.x] = 1
             spawn_y = tile.y * TILE_SIZE - TILE_SIZE * 0.5
             self.powerup_spawns.append(
                 SpawnPoint(tile.x * TILE_SIZE + TILE_SIZE / 2, spawn_y)
@@ -178,10 +269,9 @@ class Level:
         candidate_columns = range(goal_column, self.width - 1)
         goal_y = self.height - self.base_ground_height - 4
         for column in candidate_columns:
-            surface_tiles = [tile for tile in self._ground_surface_tiles if tile.x == column]
-            if surface_tiles:
-                top_tile = min(surface_tiles, key=lambda t: t.y)
-                goal_y = top_tile.y - 3
+            top_y = self._ground_top_by_column.get(column)
+            if top_y is not None:
+                goal_y = top_y - 3
                 goal_column = column
                 break
         goal_x = goal_column * TILE_SIZE
@@ -192,7 +282,14 @@ class Level:
 
     @property
     def tiles(self) -> Sequence[Tile]:
-        return tuple(self._tiles)
+        return tuple(tile for tile in self._tile_grid if tile is not None)
+
+    def is_solid(self, x: int, y: int) -> bool:
+        """Return whether the grid cell at ``(x, y)`` holds a solid tile."""
+
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self._solid[y * self.width + x])
+        return False
 
     def tiles_in_region(self, rect: pygame.Rect) -> Iterator[Tile]:
         """Return tiles that intersect the given rectangle."""
@@ -201,17 +298,66 @@ class Level:
         max_x = min(self.width - 1, rect.right // TILE_SIZE + 1)
         min_y = max(0, rect.top // TILE_SIZE - 1)
         max_y = min(self.height - 1, rect.bottom // TILE_SIZE + 1)
+        width = self.width
+        grid = self._tile_grid
         for x in range(min_x, max_x + 1):
             for y in range(min_y, max_y + 1):
-                tile = Tile(x, y)
-                if tile in self._tiles:
+                tile = grid[y * width + x]
+                if tile is not None:
                     yield tile
 
+    def colliders_in_region(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Return the cached rects of solid tiles near the given rectangle.
+
+        Uses the same bounds and column-major order as :meth:`tiles_in_region`.
+        """
+
+        min_x = max(0, rect.left // TILE_SIZE - 1)
+        max_x = min(self.width - 1, rect.right // TILE_SIZE + 1)
+        min_y = max(0, rect.top // TILE_SIZE - 1)
+        max_y = min(self.height - 1, rect.bottom // TILE_SIZE + 1)
+        width = self.width
+        grid = self._tile_grid
+        colliders: List[pygame.Rect] = []
+        for x in range(min_x, max_x + 1):
+            for index in range(min_y * width + x, max_y * width + x + 1, width):
+                tile = grid[index]
+                if tile is not None:
+                    colliders.append(tile.rect)
+        return colliders
+
+    def hazards_in_region(self, rect: pygame.Rect) -> Iterator[Hazard]:
+        """Return hazards in the tile columns spanned by the given rectangle."""
+
+        min_x = max(0, rect.left // TILE_SIZE - 1)
+        max_x = min(self.width - 1, rect.right // TILE_SIZE + 1)
+        buckets = self._hazards_by_column
+        for x in range(min_x, max_x + 1):
+            yield from buckets.get(x, ())
+
+    def hazard_rects_in_region(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Return the cached rects of hazards in the same columns as :meth:`hazards_in_region`."""
+
+        min_x = max(0, rect.left // TILE_SIZE - 1)
+        max_x = min(self.width - 1, rect.right // TILE_SIZE + 1)
+        buckets = self._hazard_rects_by_column
+        rects: List[pygame.Rect] = []
+        for x in range(min_x, max_x + 1):
+            rects.extend(buckets.get(x, ()))
+        return rects
+
+    def surface_kind(self, tile: Tile) -> int:
+        """Return ``SURFACE_GROUND``, ``SURFACE_PLATFORM`` or ``SURFACE_NONE`` for ``tile``."""
+
+        if 0 <= tile.x < self.width and 0 <= tile.y < self.height:
+            return self._surface[tile.y * self.width + tile.x]
+        return SURFACE_NONE
+
     def is_surface_tile(self, tile: Tile) -> bool:
-        return tile in self._surface_tiles
+        return self.surface_kind(tile) != SURFACE_NONE
 
     def is_ground_surface(self, tile: Tile) -> bool:
-        return tile in self._ground_surface_tiles
+        return self.surface_kind(tile) == SURFACE_GROUND
 
     @property
     def pixel_width(self) -> int:
@@ -6,17 +6,20 @@ import json
 import math
 import random
 import sys
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 import pygame
 
-from level import TILE_SIZE, Level, create_default_level
+from level import SURFACE_GROUND, SURFACE_NONE, SURFACE_PLATFORM, TILE_SIZE, Level, Tile, create_default_level
 
 SCREEN_WIDTH = 960
 SCREEN_HEIGHT = 540
 FPS = 60
+FIXED_DT = 1 / FPS
+MAX_FRAME_TIME = 0.25
 GRAVITY = 1650
 MOVE_SPEED = 250
 MOVE_ACCEL = 1850
@@ -27,19 +30,51 @@ JUMP_BUFFER_TIME = 0.14
 COYOTE_TIME = 0.12
 SCORE_FILE = Path(__file__).with_name("scores.json")
 SCOREBOARD_LIMIT = 7
+LEFT_KEYS = (pygame.K_LEFT, pygame.K_a)
+RIGHT_KEYS = (pygame.K_RIGHT, pygame.K_d)
+JUMP_KEYS = (pygame.K_SPACE, pygame.K_UP, pygame.K_w)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+CULL_MARGIN = 32
+TEXT_CULL_MARGIN = 200
+TEXT_CACHE_SIZE = 256
+TEXT_ALPHA_STEP = 8
+MAGNET_RADIUS = 240
+MAGNET_RADIUS_SQ = MAGNET_RADIUS * MAGNET_RADIUS
+# Wider than any pickup's hitbox half-width, so items beyond it horizontally can skip the exact test.
+PICKUP_REACH = 16
+PICKUP_CELL_SIZE = TILE_SIZE * 2
+ROTATION_STEP = 5
+ROTATION_STEPS = 360 // ROTATION_STEP
+BOB_AMPLITUDE = 6
+
+
+@dataclass(frozen=True, slots=True)
+class PowerUpDefinition:
+    label: str
+    duration: float
+    color: Tuple[int, int, int]
+
 
-POWERUP_DEFINITIONS: Dict[str, Dict[str, object]] = {
-    "double_jump": {"label": "Salto Duplo", "duration": 10.0, "color": (255, 194, 107)},
-    "speed_boost": {"label": "Turbo", "duration": 6.0, "color": (106, 235, 214)},
-    "magnet": {"label": "Ímã", "duration": 7.5, "color": (197, 135, 255)},
-    "shield": {"label": "Escudo", "duration": 12.0, "color": (138, 212, 255)},
+POWERUP_DEFINITIONS: Dict[str, PowerUpDefinition] = {
+    "double_jump": PowerUpDefinition("Salto Duplo", 10.0, (255, 194, 107)),
+    "speed_boost": PowerUpDefinition("Turbo", 6.0, (106, 235, 214)),
+    "magnet": PowerUpDefinition("Ímã", 7.5, (197, 135, 255)),
+    "shield": PowerUpDefinition("Escudo", 12.0, (138, 212, 255)),
 }
+POWERUP_TYPES = tuple(POWERUP_DEFINITIONS)
+POWERUP_INDEX = {power_type: index for index, power_type in enumerate(POWERUP_TYPES)}
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationFrame:
     surface: pygame.Surface
     duration: float
+    flipped: pygame.Surface = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.flipped = pygame.transform.flip(self.surface, True, False)
 
 
 class Player:
@@ -47,6 +82,8 @@ class Player:
 
     def __init__(self, position: Tuple[float, float]) -> None:
         self.position = pygame.Vector2(position)
+        # Where the last fixed step started, so frames between steps can be drawn interpolated.
+        self.previous_position = pygame.Vector2(position)
         self.velocity = pygame.Vector2(0, 0)
         self.on_ground = False
         self.facing_right = True
@@ -59,70 +96,45 @@ class Player:
         self.max_air_jumps = 0
         self.air_jumps_used = 0
         self.speed_bonus = 0.0
-        self.active_effects: Dict[str, float] = {}
+        # Seconds left on each power-up, indexed like POWERUP_TYPES; 0.0 means inactive.
+        self.effect_remaining: List[float] = [0.0] * len(POWERUP_TYPES)
         self.shield_charges = 0
 
     def _build_sprites(self) -> None:
-        palette = {
-            "skin": (239, 211, 150),
-            "shirt": (74, 132, 252),
-            "pants": (58, 58, 72),
-            "boots": (36, 32, 48),
-            "outline": (24, 28, 46),
-            "accent": (255, 116, 104),
-        }
-        width, height = 18, 26
-        idle = pygame.Surface((width, height), pygame.SRCALPHA)
-        run1 = pygame.Surface((width, height), pygame.SRCALPHA)
-        run2 = pygame.Surface((width, height), pygame.SRCALPHA)
-        jump = pygame.Surface((width, height), pygame.SRCALPHA)
-
-        def draw_base(surface: pygame.Surface) -> None:
-            surface.fill((0, 0, 0, 0))
-            pygame.draw.rect(surface, palette["outline"], (4, 5, 10, 20))
-            pygame.draw.rect(surface, palette["shirt"], (5, 6, 8, 9))
-            pygame.draw.rect(surface, palette["pants"], (5, 15, 8, 8))
-            pygame.draw.rect(surface, palette["boots"], (5, 21, 4, 3))
-            pygame.draw.rect(surface, palette["boots"], (9, 21, 4, 3))
-            pygame.draw.rect(surface, palette["skin"], (7, 1, 4, 5))
-            pygame.draw.rect(surface, palette["skin"], (5, 13, 3, 3))
-            pygame.draw.rect(surface, palette["skin"], (10, 13, 3, 3))
-            pygame.draw.rect(surface, palette["accent"], (11, 10, 2, 2))
-
-        def draw_run(surface: pygame.Surface, left_offset: int, right_offset: int) -> None:
-            draw_base(surface)
-            pygame.draw.rect(surface, palette["pants"], (4 + left_offset, 20, 4, 4))
-            pygame.draw.rect(surface, palette["pants"], (10 + right_offset, 18, 4, 4))
-
-        def draw_jump(surface: pygame.Surface) -> None:
-            draw_base(surface)
-            pygame.draw.rect(surface, palette["pants"], (4, 18, 4, 4))
-            pygame.draw.rect(surface, palette["pants"], (10, 20, 4, 4))
-
-        draw_base(idle)
-        draw_run(run1, -2, 2)
-        draw_run(run2, 2, -2)
-        draw_jump(jump)
-
-        self.idle_frames = [AnimationFrame(idle, 0.55)]
-        self.run_frames = [AnimationFrame(run1, 0.08), AnimationFrame(run2, 0.08)]
-        self.jump_frame = AnimationFrame(jump, 0.1)
-
-    def update(self, dt: float, level: Level, pressed: pygame.key.ScancodeWrapper) -> None:
+        self.idle_frames, self.run_frames, self.jump_frames, self.shield_overlay = build_player_sprites()
+        width, height = self.jump_frames[0].surface.get_size()
+        self.shield_offset = pygame.Vector2(
+            (self.shield_overlay.get_width() - width) / 2, (self.shield_overlay.get_height() - height) / 2
+        )
+        self._shielded_sprites: Dict[Tuple[pygame.Surface, bool], pygame.Surface] = {}
+
+    def _shielded_sprite(self, frame: AnimationFrame) -> pygame.Surface:
+        """Return ``frame`` pre-composited inside the shield ring, facing the current way."""
+
+        key = (frame.surface, self.facing_right)
+        composite = self._shielded_sprites.get(key)
+        if composite is None:
+            sprite = frame.surface if self.facing_right else frame.flipped
+            # The ring and the sprite do not overlap, so stacking order is irrelevant.
+            composite = self.shield_overlay.copy()
+            composite.blit(sprite, self.shield_offset)
+            self._shielded_sprites[key] = composite
+        return composite
+
+    def update(self, dt: float, level: Level, inputs: int) -> None:
+        self.previous_position.update(self.position)
         was_on_ground = self.on_ground
         self._update_effects(dt)
-        self._handle_input(pressed, dt, was_on_ground)
+        self._handle_input(inputs, dt, was_on_ground)
         self._apply_gravity(dt)
         self._move_and_collide(dt, level)
         self._update_animation(dt)
 
-    def _handle_input(
-        self, pressed: pygame.key.ScancodeWrapper, dt: float, was_on_ground: bool
-    ) -> None:
+    def _handle_input(self, inputs: int, dt: float, was_on_ground: bool) -> None:
         move = 0
-        if pressed[pygame.K_LEFT] or pressed[pygame.K_a]:
+        if inputs & INPUT_LEFT:
             move -= 1
-        if pressed[pygame.K_RIGHT] or pressed[pygame.K_d]:
+        if inputs & INPUT_RIGHT:
             move += 1
 
         if move != 0:
@@ -138,11 +150,12 @@ class Player:
             slow = MOVE_DECEL * dt
             if abs(self.velocity.x) <= slow:
                 self.velocity.x = 0
+            elif self.velocity.x > 0:
+                self.velocity.x -= slow
             else:
-                self.velocity.x -= slow * math.copysign(1, self.velocity.x)
+                self.velocity.x += slow
 
-        jumping = pressed[pygame.K_SPACE] or pressed[pygame.K_UP] or pressed[pygame.K_w]
-        if jumping:
+        if inputs & INPUT_JUMP:
             if not self.jump_key_down:
                 self.jump_buffer = JUMP_BUFFER_TIME
             self.jump_key_down = True
@@ -177,8 +190,11 @@ class Player:
     def _move_and_collide(self, dt: float, level: Level) -> None:
         self.position.x += self.velocity.x * dt
         player_rect = self.rect
-        colliders = [tile.rect for tile in level.tiles_in_region(player_rect)]
-        for collider in colliders:
+        colliders = level.colliders_in_region(player_rect)
+        # Tiles before the first overlap cannot be hit, since the rect only changes on a hit;
+        # collidelist finds that starting point in C and most frames it finds nothing at all.
+        first_hit = player_rect.collidelist(colliders)
+        for collider in colliders[first_hit:] if first_hit >= 0 else ():
             if player_rect.colliderect(collider):
                 if self.velocity.x > 0:
                     self.position.x = collider.left - player_rect.width
@@ -188,10 +204,11 @@ class Player:
 
         self.position.y += self.velocity.y * dt
         player_rect = self.rect
-        colliders = [tile.rect for tile in level.tiles_in_region(player_rect)]
+        colliders = level.colliders_in_region(player_rect)
         was_grounded = self.on_ground
         self.on_ground = False
-        for collider in colliders:
+        first_hit = player_rect.collidelist(colliders)
+        for collider in colliders[first_hit:] if first_hit >= 0 else ():
             if player_rect.colliderect(collider):
                 if self.velocity.y > 0:
                     self.position.y = collider.top - player_rect.height
@@ -206,7 +223,7 @@ class Player:
             self.coyote_timer = COYOTE_TIME
 
     def _update_animation(self, dt: float) -> None:
-        frames = list(self._get_animation_frames())
+        frames = self._get_animation_frames()
         self.animation_time += dt
         if len(frames) == 1:
             self.current_frame_index = 0
@@ -217,23 +234,24 @@ class Player:
                 self.animation_time -= frame_duration
                 self.current_frame_index = (self.current_frame_index + 1) % len(frames)
 
-    def _get_animation_frames(self) -> Iterable[AnimationFrame]:
+    def _get_animation_frames(self) -> Tuple[AnimationFrame, ...]:
         if not self.on_ground:
-            return [self.jump_frame]
+            return self.jump_frames
         if abs(self.velocity.x) > 30:
             return self.run_frames
         return self.idle_frames
 
     def _update_effects(self, dt: float) -> None:
-        expired = []
-        for effect, remaining in list(self.active_effects.items()):
+        effect_remaining = self.effect_remaining
+        for index, remaining in enumerate(effect_remaining):
+            if remaining <= 0.0:
+                continue
             remaining -= dt
-            if remaining <= 0:
-                expired.append(effect)
-            else:
-                self.active_effects[effect] = remaining
-        for effect in expired:
-            del self.active_effects[effect]
+            if remaining > 0.0:
+                effect_remaining[index] = remaining
+                continue
+            effect_remaining[index] = 0.0
+            effect = POWERUP_TYPES[index]
             if effect == "double_jump":
                 self.max_air_jumps = 0
                 self.air_jumps_used = 0
@@ -243,7 +261,7 @@ class Player:
                 self.shield_charges = 0
 
     def apply_powerup(self, power_type: str, duration: float) -> None:
-        self.active_effects[power_type] = duration
+        self.effect_remaining[POWERUP_INDEX[power_type]] = duration
         if power_type == "double_jump":
             self.max_air_jumps = 1
             self.air_jumps_used = 0
@@ -257,12 +275,12 @@ class Player:
     def consume_shield(self) -> bool:
         if self.shield_charges > 0:
             self.shield_charges = 0
-            self.active_effects.pop("shield", None)
+            self.effect_remaining[POWERUP_INDEX["shield"]] = 0.0
             return True
         return False
 
     def has_effect(self, effect: str) -> bool:
-        return effect in self.active_effects
+        return self.effect_remaining[POWERUP_INDEX[effect]] > 0.0
 
     @property
     def speed_multiplier(self) -> float:
@@ -273,108 +291,123 @@ class Player:
         surface = self.current_surface
         return surface.get_rect(topleft=(int(self.position.x), int(self.position.y)))
 
+    @property
+    def current_frame(self) -> AnimationFrame:
+        frames = self._get_animation_frames()
+        return frames[self.current_frame_index % len(frames)]
+
     @property
     def current_surface(self) -> pygame.Surface:
-        frames = list(self._get_animation_frames())
-        frame = frames[self.current_frame_index % len(frames)]
-        return frame.surface
+        return self.current_frame.surface
 
-    def draw(self, surface: pygame.Surface, offset: pygame.Vector2) -> None:
-        sprite = self.current_surface
-        if not self.facing_right:
-            sprite = pygame.transform.flip(sprite, True, False)
-        position = self.position - offset
-        surface.blit(sprite, position)
+    def interpolated_position(self, alpha: float) -> pygame.Vector2:
+        """Return the position ``alpha`` of the way from the previous fixed step to the current one."""
+
+        return self.previous_position.lerp(self.position, alpha)
+
+    def draw(self, surface: pygame.Surface, offset: pygame.Vector2, alpha: float = 1.0) -> None:
+        frame = self.current_frame
+        position = self.interpolated_position(alpha)
+        x = position.x - offset.x
+        y = position.y - offset.y
         if self.shield_charges > 0 or self.has_effect("shield"):
-            radius = max(sprite.get_width(), sprite.get_height())
-            overlay = pygame.Surface((radius + 12, radius + 12), pygame.SRCALPHA)
-            pygame.draw.circle(
-                overlay,
-                (140, 220, 255, 90),
-                overlay.get_rect().center,
-                max(10, (radius + 6) // 2),
-                3,
-            )
-            offset_pos = position - pygame.Vector2(
-                (overlay.get_width() - sprite.get_width()) / 2,
-                (overlay.get_height() - sprite.get_height()) / 2,
-            )
-            surface.blit(overlay, offset_pos)
+            surface.blit(self._shielded_sprite(frame), (x - self.shield_offset.x, y - self.shield_offset.y))
+            return
+        surface.blit(frame.surface if self.facing_right else frame.flipped, (x, y))
 
 
-@dataclass
+@dataclass(slots=True)
 class Collectible:
-    base_position: pygame.Vector2
-    frames: List[pygame.Surface]
+    position: pygame.Vector2
+    frames: Tuple[pygame.Surface, ...]
     phase: float
     value: int = 120
-    position: pygame.Vector2 = field(init=False)
+    # Only the resting height is needed to bob; x is never reset, so no second vector is kept.
+    base_y: float = field(init=False)
+    previous_position: pygame.Vector2 = field(init=False)
+    cell: int = field(init=False, default=0)
+    slot: int = field(init=False, default=0)
+    radius_sq: float = field(init=False)
 
     def __post_init__(self) -> None:
-        self.position = self.base_position.copy()
+        self.base_y = self.position.y
+        self.previous_position = pygame.Vector2(self.position)
+        radius = self.frames[0].get_width() * 0.35
+        self.radius_sq = radius * radius
 
-    def update(self, dt: float, player: Player) -> None:
+    def update(self, dt: float, magnet_center: Tuple[float, float] | None) -> None:
+        self.previous_position.update(self.position)
         self.phase += dt * 4.5
-        self.position.y = self.base_position.y + math.sin(self.phase) * 6
-        if player.has_effect("magnet"):
-            player_center = pygame.Vector2(player.rect.center)
-            diff = player_center - self.position
-            distance = diff.length()
-            if 0 < distance < 240:
-                pull = max(140, 320 - distance)
-                self.position += diff.normalize() * pull * dt
+        self.position.y = self.base_y + math.sin(self.phase) * BOB_AMPLITUDE
+        if magnet_center is not None:
+            dx = magnet_center[0] - self.position.x
+            dy = magnet_center[1] - self.position.y
+            distance_sq = dx * dx + dy * dy
+            if 0 < distance_sq < MAGNET_RADIUS_SQ:
+                distance = math.sqrt(distance_sq)
+                step = max(140, 320 - distance) * dt / distance
+                self.position.x += dx * step
+                self.position.y += dy * step
 
     def sprite(self) -> pygame.Surface:
         index = int(self.phase * 5) % len(self.frames)
         return self.frames[index]
 
     def collides_with(self, rect: pygame.Rect) -> bool:
-        radius = self.frames[0].get_width() * 0.35
-        closest_x = max(rect.left, min(self.position.x, rect.right))
-        closest_y = max(rect.top, min(self.position.y, rect.bottom))
-        diff_x = self.position.x - closest_x
-        diff_y = self.position.y - closest_y
-        return diff_x * diff_x + diff_y * diff_y <= radius * radius
+        x, y = self.position
+        diff_x = x - max(rect.left, min(x, rect.right))
+        diff_y = y - max(rect.top, min(y, rect.bottom))
+        return diff_x * diff_x + diff_y * diff_y <= self.radius_sq
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUpItem:
     power_type: str
     position: pygame.Vector2
     sprite: pygame.Surface
     rotation: float = 0.0
+    # Power-ups never move, so the hitbox is built once and handed to colliderect as an exact Rect.
+    hitbox: pygame.Rect = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.hitbox = self.sprite.get_rect(center=self.position)
 
     def update(self, dt: float) -> None:
         self.rotation = (self.rotation + dt * 120) % 360
 
+    def blit_args(self, offset: pygame.Vector2) -> Tuple[pygame.Surface, pygame.Rect]:
+        rotated = rotated_sprite(self.sprite, int(self.rotation) // ROTATION_STEP % ROTATION_STEPS)
+        return rotated, rotated.get_rect(center=(self.position.x - offset.x, self.position.y - offset.y))
+
     def draw(self, surface: pygame.Surface, offset: pygame.Vector2) -> None:
-        rotated = pygame.transform.rotozoom(self.sprite, self.rotation, 1.0)
-        rect = rotated.get_rect(center=self.position - offset)
-        surface.blit(rotated, rect)
+        surface.blit(*self.blit_args(offset))
 
     def collides_with(self, rect: pygame.Rect) -> bool:
-        hitbox = pygame.Rect(0, 0, self.sprite.get_width(), self.sprite.get_height())
-        hitbox.center = self.position
-        return rect.colliderect(hitbox)
+        return rect.colliderect(self.hitbox)
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatingText:
     text: str
-    position: pygame.Vector2
+    position: Tuple[float, float]
     color: Tuple[int, int, int]
     lifetime: float = 1.2
     elapsed: float = 0.0
+    previous_position: Tuple[float, float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.previous_position = self.position
 
     def update(self, dt: float) -> None:
         self.elapsed += dt
-        self.position.y -= 28 * dt
+        self.previous_position = x, y = self.position
+        self.position = (x, y - 28 * dt)
 
     def alpha(self) -> int:
         return max(0, min(255, int(255 * (1 - self.elapsed / self.lifetime))))
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class ScoreEntry:
     score: int
     name: str = field(compare=False)
@@ -416,23 +449,30 @@ class ScoreManager:
         if self.path.exists():
             try:
                 data = json.loads(self.path.read_text(encoding="utf-8"))
-                self.entries = [ScoreEntry.from_dict(item) for item in data]
+                self.entries = sorted((ScoreEntry.from_dict(item) for item in data), reverse=True)[: self.limit]
             except (json.JSONDecodeError, OSError):
                 self.entries = []
         else:
             self.path.write_text("[]", encoding="utf-8")
 
     def save(self) -> None:
+        # Write to a sibling file and swap it in so a crash never truncates the ranking.
+        temp_path = self.path.with_name(self.path.name + ".tmp")
         try:
             data = [entry.to_dict() for entry in self.entries[: self.limit]]
-            self.path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            temp_path.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            temp_path.replace(self.path)
         except OSError:
             pass
 
     def add_entry(self, entry: ScoreEntry) -> None:
-        self.entries.append(entry)
-        self.entries.sort(reverse=True)
-        self.entries = self.entries[: self.limit]
+        entries = self.entries
+        if len(entries) >= self.limit and entry <= entries[-1]:
+            # The entry would be cut from a full ranking straight away, so nothing on disk changes.
+            return
+        entries.append(entry)
+        entries.sort(reverse=True)
+        del entries[self.limit :]
         self.save()
 
     def top_entries(self) -> List[ScoreEntry]:
@@ -443,15 +483,74 @@ class ScoreManager:
 class GameSession:
     level: Level
     player: Player
-    collectibles: List[Collectible]
+    collectibles: InitVar[List[Collectible]]
     powerups: List[PowerUpItem]
     floating_texts: List[FloatingText]
     rng: random.Random
+    tile_strips: Dict[int, List[Tuple[int, pygame.Surface]]] = field(default_factory=dict)
     base_score: int = 0
     crystals: int = 0
     max_distance: float = 0.0
     elapsed: float = 0.0
     result: str = ""
+    # Collectibles bucketed by PICKUP_CELL_SIZE-wide column so pickup checks only visit nearby ones.
+    collectible_cells: Dict[int, List[Collectible]] = field(init=False, default_factory=dict)
+    camera_max_x: float = field(init=False, default=0.0)
+    camera_max_y: float = field(init=False, default=0.0)
+
+    def __post_init__(self, collectibles: List[Collectible]) -> None:
+        self.camera_max_x = self.level.pixel_width - SCREEN_WIDTH
+        self.camera_max_y = self.level.pixel_height - SCREEN_HEIGHT
+        for collectible in collectibles:
+            self._insert_collectible(collectible)
+
+    def _insert_collectible(self, collectible: Collectible) -> None:
+        collectible.cell = int(collectible.position.x) // PICKUP_CELL_SIZE
+        bucket = self.collectible_cells.setdefault(collectible.cell, [])
+        collectible.slot = len(bucket)
+        bucket.append(collectible)
+
+    def _remove_from_cell(self, collectible: Collectible) -> None:
+        # Move the bucket's last crystal into the freed slot so removal never shifts the list.
+        bucket = self.collectible_cells[collectible.cell]
+        last = bucket.pop()
+        if last is not collectible:
+            bucket[collectible.slot] = last
+            last.slot = collectible.slot
+
+    def rehash_collectible(self, collectible: Collectible) -> None:
+        """Move ``collectible`` to its current cell after it has drifted horizontally."""
+
+        if int(collectible.position.x) // PICKUP_CELL_SIZE != collectible.cell:
+            self._remove_from_cell(collectible)
+            self._insert_collectible(collectible)
+
+    def collectibles_between(self, left: float, right: float) -> List[Collectible]:
+        cells = self.collectible_cells
+        found: List[Collectible] = []
+        for cell in range(int(left) // PICKUP_CELL_SIZE, int(right) // PICKUP_CELL_SIZE + 1):
+            bucket = cells.get(cell)
+            if bucket:
+                found.extend(bucket)
+        return found
+
+    def collectibles_in_view(self, camera_offset: pygame.Vector2) -> List[Collectible]:
+        left, _, right, _ = visible_bounds(camera_offset)
+        return self.collectibles_between(left, right)
+
+    def remove_collectible(self, collectible: Collectible) -> None:
+        self._remove_from_cell(collectible)
+
+    def camera_offset(self, alpha: float = 1.0) -> pygame.Vector2:
+        """Return the top-left of the view, centred on the player and clamped to the level.
+
+        ``alpha`` follows the player's interpolated position between fixed steps.
+        """
+
+        x, y = self.player.interpolated_position(alpha)
+        camera_x = max(0, min(self.camera_max_x, x - SCREEN_WIDTH / 2))
+        camera_y = max(0, min(self.camera_max_y, y - SCREEN_HEIGHT / 2))
+        return pygame.Vector2(camera_x, camera_y)
 
     def final_score(self) -> int:
         distance_bonus = int(self.max_distance / TILE_SIZE) * 10
@@ -478,13 +577,13 @@ class GameState:
             Collectible(spawn.to_vector(), collectible_frames, rng.random() * math.tau)
             for spawn in level.collectible_spawns
         ]
-        powerup_types = list(POWERUP_DEFINITIONS.keys())
         powerups: List[PowerUpItem] = []
         for spawn in level.powerup_spawns:
-            power_type = rng.choice(powerup_types)
-            sprite = build_powerup_sprite(tuple(POWERUP_DEFINITIONS[power_type]["color"]))
+            power_type = rng.choice(POWERUP_TYPES)
+            sprite = build_powerup_sprite(POWERUP_DEFINITIONS[power_type].color)
             powerups.append(PowerUpItem(power_type, spawn.to_vector(), sprite))
-        self.session = GameSession(level, player, collectibles, powerups, [], rng)
+        tile_strips = build_tile_strips(level, build_tile_palette())
+        self.session = GameSession(level, player, collectibles, powerups, [], rng, tile_strips)
         self.mode = "running"
         self.pending_entry = None
         self.awaiting_name = False
@@ -523,13 +622,50 @@ class GameState:
         self.awaiting_name = False
         self.name_input = ""
 
+    def return_to_title(self) -> None:
+        self.mode = "title"
+        self.session = None
+
+
+# Per-mode key bindings for everything except typing a name on the game-over screen.
+KEY_ACTIONS: Dict[str, Dict[int, Callable[[GameState], None]]] = {
+    "title": {pygame.K_RETURN: GameState.start_new_session, pygame.K_SPACE: GameState.start_new_session},
+    "running": {pygame.K_r: GameState.return_to_title},
+    "game_over": {
+        pygame.K_r: GameState.return_to_title,
+        pygame.K_SPACE: GameState.return_to_title,
+        pygame.K_RETURN: GameState.return_to_title,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def gradient_colors(
+    color_top: Tuple[int, int, int], color_bottom: Tuple[int, int, int], steps: int
+) -> Tuple[Tuple[int, int, int], ...]:
+    """Return ``steps`` colours linearly interpolated from top to bottom."""
+
+    colors = []
+    for y in range(steps):
+        t = y / steps
+        colors.append(tuple(int(color_top[i] * (1 - t) + color_bottom[i] * t) for i in range(3)))
+    return tuple(colors)
+
+
+def create_vertical_gradient(
+    size: Tuple[int, int], color_top: Tuple[int, int, int], color_bottom: Tuple[int, int, int]
+) -> pygame.Surface:
+    """Build an opaque top-to-bottom gradient from a single one-pixel column."""
+
+    width, height = size
+    column = bytes(channel for color in gradient_colors(color_top, color_bottom, height) for channel in color)
+    strip = pygame.image.frombuffer(column, (1, height), "RGB")
+    return pygame.transform.scale(strip, (width, height))
+
 
 def create_tile_surface(color_top: Tuple[int, int, int], color_bottom: Tuple[int, int, int]) -> pygame.Surface:
     tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-    for y in range(TILE_SIZE):
-        t = y / TILE_SIZE
-        color = [int(color_top[i] * (1 - t) + color_bottom[i] * t) for i in range(3)]
-        pygame.draw.line(tile, color, (0, y), (TILE_SIZE, y))
+    tile.blit(create_vertical_gradient((TILE_SIZE, TILE_SIZE), color_top, color_bottom), (0, 0))
     return tile
 
 
@@ -577,7 +713,63 @@ def build_spike_surface(width: int, height: int) -> pygame.Surface:
     return surface
 
 
-def build_collectible_frames() -> List[pygame.Surface]:
+@lru_cache(maxsize=None)
+def build_player_sprites() -> Tuple[
+    Tuple[AnimationFrame, ...], Tuple[AnimationFrame, ...], Tuple[AnimationFrame, ...], pygame.Surface
+]:
+    palette = {
+        "skin": (239, 211, 150),
+        "shirt": (74, 132, 252),
+        "pants": (58, 58, 72),
+        "boots": (36, 32, 48),
+        "outline": (24, 28, 46),
+        "accent": (255, 116, 104),
+    }
+    width, height = 18, 26
+    idle = pygame.Surface((width, height), pygame.SRCALPHA)
+    run1 = pygame.Surface((width, height), pygame.SRCALPHA)
+    run2 = pygame.Surface((width, height), pygame.SRCALPHA)
+    jump = pygame.Surface((width, height), pygame.SRCALPHA)
+
+    def draw_base(surface: pygame.Surface) -> None:
+        surface.fill((0, 0, 0, 0))
+        pygame.draw.rect(surface, palette["outline"], (4, 5, 10, 20))
+        pygame.draw.rect(surface, palette["shirt"], (5, 6, 8, 9))
+        pygame.draw.rect(surface, palette["pants"], (5, 15, 8, 8))
+        pygame.draw.rect(surface, palette["boots"], (5, 21, 4, 3))
+        pygame.draw.rect(surface, palette["boots"], (9, 21, 4, 3))
+        pygame.draw.rect(surface, palette["skin"], (7, 1, 4, 5))
+        pygame.draw.rect(surface, palette["skin"], (5, 13, 3, 3))
+        pygame.draw.rect(surface, palette["skin"], (10, 13, 3, 3))
+        pygame.draw.rect(surface, palette["accent"], (11, 10, 2, 2))
+
+    def draw_run(surface: pygame.Surface, left_offset: int, right_offset: int) -> None:
+        draw_base(surface)
+        pygame.draw.rect(surface, palette["pants"], (4 + left_offset, 20, 4, 4))
+        pygame.draw.rect(surface, palette["pants"], (10 + right_offset, 18, 4, 4))
+
+    def draw_jump(surface: pygame.Surface) -> None:
+        draw_base(surface)
+        pygame.draw.rect(surface, palette["pants"], (4, 18, 4, 4))
+        pygame.draw.rect(surface, palette["pants"], (10, 20, 4, 4))
+
+    draw_base(idle)
+    draw_run(run1, -2, 2)
+    draw_run(run2, 2, -2)
+    draw_jump(jump)
+
+    idle_frames = (AnimationFrame(idle, 0.55),)
+    run_frames = (AnimationFrame(run1, 0.08), AnimationFrame(run2, 0.08))
+    jump_frames = (AnimationFrame(jump, 0.1),)
+
+    radius = max(width, height)
+    shield = pygame.Surface((radius + 12, radius + 12), pygame.SRCALPHA)
+    pygame.draw.circle(shield, (140, 220, 255, 90), shield.get_rect().center, max(10, (radius + 6) // 2), 3)
+    return idle_frames, run_frames, jump_frames, shield
+
+
+@lru_cache(maxsize=None)
+def build_collectible_frames() -> Tuple[pygame.Surface, ...]:
     frames: List[pygame.Surface] = []
     for i in range(6):
         surface = pygame.Surface((18, 18), pygame.SRCALPHA)
@@ -590,9 +782,10 @@ def build_collectible_frames() -> List[pygame.Surface]:
         pygame.draw.polygon(surface, (255, 204, 94), points)
         pygame.draw.polygon(surface, (255, 246, 198), points, 2)
         frames.append(surface)
-    return frames
+    return tuple(frames)
 
 
+@lru_cache(maxsize=None)
 def build_powerup_sprite(color: Tuple[int, int, int]) -> pygame.Surface:
     surface = pygame.Surface((24, 24), pygame.SRCALPHA)
     pygame.draw.circle(surface, color, (12, 12), 10)
@@ -614,72 +807,207 @@ def build_goal_surface(width: int, height: int) -> pygame.Surface:
     return surface
 
 
+@lru_cache(maxsize=None)
+def build_panel_surface(
+    size: Tuple[int, int],
+    color: Tuple[int, ...],
+    border_color: Tuple[int, int, int] | None = None,
+) -> pygame.Surface:
+    """Return a cached flat-colour panel; callers must not draw onto it."""
+
+    surface = pygame.Surface(size, pygame.SRCALPHA if len(color) == 4 else 0)
+    surface.fill(color)
+    if border_color is not None:
+        pygame.draw.rect(surface, border_color, surface.get_rect(), 2)
+    return surface
+
+
+@lru_cache(maxsize=None)
+def scaled_surface(source: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+    """Return ``source`` smoothscaled to ``size``, resampling each source/size pair only once."""
+
+    if source.get_size() == tuple(size):
+        return source
+    return pygame.transform.smoothscale(source, size)
+
+
+@lru_cache(maxsize=None)
+def rotated_sprite(sprite: pygame.Surface, step: int) -> pygame.Surface:
+    """Return ``sprite`` rotated by ``step`` increments of ROTATION_STEP degrees."""
+
+    return pygame.transform.rotozoom(sprite, step * ROTATION_STEP, 1.0)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+    """Render anti-aliased text, reusing the surface while the same string stays on screen.
+
+    Callers must not draw onto or change the alpha of the returned surface.
+    """
+
+    return font.render(text, True, color)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def faded_text(font: pygame.font.Font, text: str, color: Tuple[int, ...], alpha: int) -> pygame.Surface:
+    """Return a copy of the cached rendering of ``text`` drawn at surface ``alpha``."""
+
+    faded = render_text(font, text, color).copy()
+    faded.set_alpha(alpha)
+    return faded
+
+
+@lru_cache(maxsize=None)
 def build_tile_palette() -> Dict[str, pygame.Surface]:
     return {
-        "ground": build_ground_tile(),
         "ground_top": build_ground_top(),
         "platform": build_platform_tile(),
         "platform_top": build_platform_top(),
     }
 
 
+def build_tile_strips(
+    level: Level, tile_palette: Dict[str, pygame.Surface]
+) -> Dict[int, List[Tuple[int, pygame.Surface]]]:
+    """Pre-composite each column's contiguous runs of tiles into single surfaces.
+
+    Returns a mapping from column to ``(top_row, strip)`` pairs so a column can be
+    drawn with one blit per run instead of one or two blits per tile.
+    """
+
+    # The *_top tiles are already the base tile with the rim drawn on, so every tile is a single blit.
+    variants = {
+        SURFACE_NONE: tile_palette["platform"],
+        SURFACE_PLATFORM: tile_palette["platform_top"],
+        SURFACE_GROUND: tile_palette["ground_top"],
+    }
+    strips: Dict[int, List[Tuple[int, pygame.Surface]]] = {}
+    for x in range(level.width):
+        runs: List[Tuple[int, pygame.Surface]] = []
+        run_start: int | None = None
+        for y in range(level.height + 1):
+            solid = y < level.height and level.is_solid(x, y)
+            if solid and run_start is None:
+                run_start = y
+            elif not solid and run_start is not None:
+                strip = pygame.Surface((TILE_SIZE, (y - run_start) * TILE_SIZE))
+                batch = []
+                for row in range(run_start, y):
+                    tile = Tile(x, row)
+                    variant = variants[level.surface_kind(tile)]
+                    batch.append((variant, (0, (row - run_start) * TILE_SIZE)))
+                strip.blits(batch, doreturn=False)
+                runs.append((run_start, strip))
+                run_start = None
+        if runs:
+            strips[x] = runs
+    return strips
+
+
+def visible_bounds(camera_offset: pygame.Vector2, margin: float = CULL_MARGIN) -> Tuple[float, float, float, float]:
+    """Return world-space ``(left, top, right, bottom)`` of the view, padded by ``margin``."""
+
+    return (
+        camera_offset.x - margin,
+        camera_offset.y - margin,
+        camera_offset.x + SCREEN_WIDTH + margin,
+        camera_offset.y + SCREEN_HEIGHT + margin,
+    )
+
+
 def draw_tiles(
     surface: pygame.Surface,
     level: Level,
     camera_offset: pygame.Vector2,
-    tile_palette: Dict[str, pygame.Surface],
+    tile_strips: Dict[int, List[Tuple[int, pygame.Surface]]],
 ) -> None:
-    camera_rect = pygame.Rect(
-        int(camera_offset.x),
-        int(camera_offset.y),
-        SCREEN_WIDTH,
-        SCREEN_HEIGHT,
-    )
-    for tile in level.tiles_in_region(camera_rect.inflate(128, 128)):
-        position = (tile.x * TILE_SIZE - camera_offset.x, tile.y * TILE_SIZE - camera_offset.y)
-        if level.is_ground_surface(tile):
-            base = tile_palette["ground"]
-            top = tile_palette["ground_top"] if level.is_surface_tile(tile) else None
-        else:
-            base = tile_palette["platform"]
-            top = tile_palette["platform_top"] if level.is_surface_tile(tile) else None
-        surface.blit(base, position)
-        if top is not None:
-            surface.blit(top, position)
+    min_x = max(0, int(camera_offset.x) // TILE_SIZE - 1)
+    max_x = min(level.width - 1, (int(camera_offset.x) + SCREEN_WIDTH) // TILE_SIZE + 1)
+    # Blit positions truncate toward zero, so a strip hanging off the top would land a pixel lower
+    # than its on-screen neighbours. Rounding the camera up once keeps every strip on the grid that
+    # truncation gives on-screen tiles and the other sprites.
+    camera_x = math.ceil(camera_offset.x)
+    camera_y = math.ceil(camera_offset.y)
+    bottom_edge = camera_y + SCREEN_HEIGHT
+    batch = []
+    for x in range(min_x, max_x + 1):
+        screen_x = x * TILE_SIZE - camera_x
+        for top_row, strip in tile_strips.get(x, ()):
+            strip_y = top_row * TILE_SIZE
+            if strip_y >= bottom_edge or strip_y + strip.get_height() <= camera_y:
+                continue
+            batch.append((strip, (screen_x, strip_y - camera_y)))
+    surface.blits(batch, doreturn=False)
 
 
 def draw_hazards(surface: pygame.Surface, level: Level, camera_offset: pygame.Vector2, spike_surface: pygame.Surface) -> None:
-    for hazard in level.hazards:
-        position = pygame.Vector2(hazard.x, hazard.y) - camera_offset
-        scaled = pygame.transform.smoothscale(spike_surface, (hazard.width, hazard.height))
-        surface.blit(scaled, position)
+    camera_rect = pygame.Rect(int(camera_offset.x), int(camera_offset.y), SCREEN_WIDTH, SCREEN_HEIGHT)
+    camera_x, camera_y = camera_offset
+    surface.blits(
+        [
+            (scaled_surface(spike_surface, (hazard.width, hazard.height)), (hazard.x - camera_x, hazard.y - camera_y))
+            for hazard in level.hazards_in_region(camera_rect)
+        ],
+        doreturn=False,
+    )
 
 
-def draw_collectibles(surface: pygame.Surface, collectibles: Iterable[Collectible], camera_offset: pygame.Vector2) -> None:
+def draw_collectibles(
+    surface: pygame.Surface, collectibles: Iterable[Collectible], camera_offset: pygame.Vector2, alpha: float = 1.0
+) -> None:
+    left, top, right, bottom = visible_bounds(camera_offset)
+    camera_x, camera_y = camera_offset
+    batch = []
     for collectible in collectibles:
+        x, y = collectible.position
+        if x < left or x > right or y < top or y > bottom:
+            continue
+        previous_x, previous_y = collectible.previous_position
+        x = previous_x + (x - previous_x) * alpha
+        y = previous_y + (y - previous_y) * alpha
         sprite = collectible.sprite()
-        rect = sprite.get_rect(center=collectible.position - camera_offset)
-        surface.blit(sprite, rect)
+        batch.append((sprite, sprite.get_rect(center=(x - camera_x, y - camera_y))))
+    surface.blits(batch, doreturn=False)
 
 
 def draw_powerups(surface: pygame.Surface, powerups: Iterable[PowerUpItem], camera_offset: pygame.Vector2) -> None:
-    for powerup in powerups:
-        powerup.draw(surface, camera_offset)
+    left, top, right, bottom = visible_bounds(camera_offset)
+    surface.blits(
+        [
+            powerup.blit_args(camera_offset)
+            for powerup in powerups
+            if left <= powerup.position.x <= right and top <= powerup.position.y <= bottom
+        ],
+        doreturn=False,
+    )
 
 
 def draw_goal(surface: pygame.Surface, level: Level, camera_offset: pygame.Vector2, goal_surface: pygame.Surface) -> None:
     rect = level.goal_rect.move(-camera_offset.x, -camera_offset.y)
-    scaled = pygame.transform.smoothscale(goal_surface, rect.size)
+    scaled = scaled_surface(goal_surface, rect.size)
     surface.blit(scaled, rect)
 
 
 def draw_floating_texts(
-    surface: pygame.Surface, texts: Iterable[FloatingText], camera_offset: pygame.Vector2, font: pygame.font.Font
+    surface: pygame.Surface,
+    texts: Iterable[FloatingText],
+    camera_offset: pygame.Vector2,
+    font: pygame.font.Font,
+    alpha: float = 1.0,
 ) -> None:
+    camera_x, camera_y = camera_offset
+    left, top, right, bottom = visible_bounds(camera_offset, TEXT_CULL_MARGIN)
+    batch = []
     for text in texts:
-        rendered = font.render(text.text, True, text.color)
-        rendered.set_alpha(text.alpha())
-        surface.blit(rendered, text.position - camera_offset)
+        x, y = text.position
+        if x < left or x > right or y < top or y > bottom:
+            continue
+        previous_y = text.previous_position[1]
+        y = previous_y + (y - previous_y) * alpha
+        # Fading in TEXT_ALPHA_STEP increments lets each label reuse a few cached surfaces.
+        fade = min(255, round(text.alpha() / TEXT_ALPHA_STEP) * TEXT_ALPHA_STEP)
+        batch.append((faded_text(font, text.text, text.color, fade), (x - camera_x, y - camera_y)))
+    surface.blits(batch, doreturn=False)
 
 
 def draw_hud(
@@ -688,38 +1016,38 @@ def draw_hud(
     font: pygame.font.Font,
     small_font: pygame.font.Font,
 ) -> None:
-    score_text = font.render(f"Pontuação: {session.final_score():04d}", True, (255, 255, 255))
-    crystals_text = small_font.render(f"Cristais: {session.crystals}", True, (230, 220, 250))
-    distance_text = small_font.render(f"Distância: {int(session.max_distance / TILE_SIZE)}m", True, (230, 220, 250))
+    score_text = render_text(font, f"Pontuação: {session.final_score():04d}", (255, 255, 255))
+    crystals_text = render_text(small_font, f"Cristais: {session.crystals}", (230, 220, 250))
+    distance_text = render_text(small_font, f"Distância: {int(session.max_distance / TILE_SIZE)}m", (230, 220, 250))
     surface.blit(score_text, (20, 16))
     surface.blit(crystals_text, (24, 56))
     surface.blit(distance_text, (24, 80))
 
     x = 24
     y = 110
-    for effect, remaining in session.player.active_effects.items():
-        definition = POWERUP_DEFINITIONS.get(effect)
-        if not definition:
+    for effect, remaining in zip(POWERUP_TYPES, session.player.effect_remaining):
+        if remaining <= 0.0:
             continue
-        label = f"{definition['label']}: {remaining:0.1f}s"
-        color = tuple(definition["color"])
-        text_surface = small_font.render(label, True, color)
+        definition = POWERUP_DEFINITIONS[effect]
+        label = f"{definition.label}: {remaining:0.1f}s"
+        color = definition.color
+        text_surface = render_text(small_font, label, color)
         surface.blit(text_surface, (x, y))
         y += 22
 
 
 def draw_rankings(surface: pygame.Surface, font: pygame.font.Font, scores: List[ScoreEntry], start_y: int = 120) -> None:
-    header = font.render("Ranking", True, (255, 255, 255))
+    header = render_text(font, "Ranking", (255, 255, 255))
     surface.blit(header, (SCREEN_WIDTH / 2 - header.get_width() / 2, start_y))
     for index, entry in enumerate(scores, start=1):
         line = f"{index:02d}. {entry.name:<12} {entry.score:05d} pts  {entry.distance:.0f}m  {entry.crystals}x"
-        text_surface = font.render(line, True, (220, 220, 240))
+        text_surface = render_text(font, line, (220, 220, 240))
         surface.blit(text_surface, (SCREEN_WIDTH / 2 - text_surface.get_width() / 2, start_y + 30 + index * 24))
 
 
 def draw_title_screen(surface: pygame.Surface, font: pygame.font.Font, small_font: pygame.font.Font, scores: List[ScoreEntry]) -> None:
-    title = font.render("Corrida Procedural", True, (255, 239, 200))
-    subtitle = small_font.render("Pressione Enter para começar", True, (230, 220, 255))
+    title = render_text(font, "Corrida Procedural", (255, 239, 200))
+    subtitle = render_text(small_font, "Pressione Enter para começar", (230, 220, 255))
     surface.blit(title, (SCREEN_WIDTH / 2 - title.get_width() / 2, 140))
     surface.blit(subtitle, (SCREEN_WIDTH / 2 - subtitle.get_width() / 2, 190))
     draw_rankings(surface, small_font, scores, start_y=240)
@@ -733,10 +1061,8 @@ def draw_game_over(
 ) -> None:
     if not state.session or not state.pending_entry:
         return
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((18, 22, 38, 210))
-    surface.blit(overlay, (0, 0))
-    title = font.render("Fim da Corrida", True, (255, 239, 200))
+    surface.blit(build_panel_surface((SCREEN_WIDTH, SCREEN_HEIGHT), (18, 22, 38, 210)), (0, 0))
+    title = render_text(font, "Fim da Corrida", (255, 239, 200))
     surface.blit(title, (SCREEN_WIDTH / 2 - title.get_width() / 2, 120))
 
     entry = state.pending_entry
@@ -748,81 +1074,107 @@ def draw_game_over(
         f"Tempo: {entry.duration:0.1f}s",
     ]
     for i, text in enumerate(stats):
-        surface.blit(small_font.render(text, True, (235, 230, 255)), (SCREEN_WIDTH / 2 - 140, 180 + i * 26))
+        surface.blit(render_text(small_font, text, (235, 230, 255)), (SCREEN_WIDTH / 2 - 140, 180 + i * 26))
 
     if state.awaiting_name:
-        prompt = small_font.render("Digite seu nome e pressione Enter", True, (255, 240, 180))
+        prompt = render_text(small_font, "Digite seu nome e pressione Enter", (255, 240, 180))
         surface.blit(prompt, (SCREEN_WIDTH / 2 - prompt.get_width() / 2, 320))
-        name_box = pygame.Surface((360, 40))
-        name_box.fill((34, 40, 68))
-        pygame.draw.rect(name_box, (150, 180, 255), name_box.get_rect(), 2)
-        name_text = font.render(state.name_input or "Jogador", True, (255, 255, 255))
-        name_box.blit(name_text, (16, 6))
-        surface.blit(name_box, (SCREEN_WIDTH / 2 - name_box.get_width() / 2, 360))
+        name_box = build_panel_surface((360, 40), (34, 40, 68), (150, 180, 255))
+        box_x = SCREEN_WIDTH / 2 - name_box.get_width() / 2
+        surface.blit(name_box, (box_x, 360))
+        name_text = render_text(font, state.name_input or "Jogador", (255, 255, 255))
+        surface.blit(name_text, (box_x + 16, 366), name_text.get_rect(size=(360 - 16, 40 - 6)))
     else:
         surface.blit(
-            small_font.render("Pressione R para tentar novamente", True, (220, 215, 255)),
+            render_text(small_font, "Pressione R para tentar novamente", (220, 215, 255)),
             (SCREEN_WIDTH / 2 - 170, 330),
         )
 
     draw_rankings(surface, small_font, state.score_manager.top_entries(), start_y=400)
 
 
-def update_session(session: GameSession, dt: float, pressed: pygame.key.ScancodeWrapper) -> str | None:
+def read_inputs(pressed: pygame.key.ScancodeWrapper) -> int:
+    """Fold the bound keys into an INPUT_* bitmask, read once per frame."""
+
+    is_pressed = pressed.__getitem__
+    inputs = 0
+    if any(map(is_pressed, LEFT_KEYS)):
+        inputs |= INPUT_LEFT
+    if any(map(is_pressed, RIGHT_KEYS)):
+        inputs |= INPUT_RIGHT
+    if any(map(is_pressed, JUMP_KEYS)):
+        inputs |= INPUT_JUMP
+    return inputs
+
+
+def update_session(session: GameSession, dt: float, inputs: int) -> str | None:
     player = session.player
-    player.update(dt, session.level, pressed)
+    player.update(dt, session.level, inputs)
     session.elapsed += dt
     session.max_distance = max(session.max_distance, player.position.x)
 
     player_rect = player.rect
 
-    collected: List[Collectible] = []
-    for collectible in session.collectibles:
-        collectible.update(dt, player)
-        if collectible.collides_with(player_rect):
-            collected.append(collectible)
-    for item in collected:
-        session.collectibles.remove(item)
-        session.base_score += item.value
-        session.crystals += 1
-        session.floating_texts.append(
-            FloatingText(f"+{item.value}", pygame.Vector2(item.position.x, item.position.y - 12), (255, 226, 146))
-        )
-
-    grabbed: List[PowerUpItem] = []
-    for powerup in session.powerups:
-        powerup.update(dt)
-        if powerup.collides_with(player_rect):
-            grabbed.append(powerup)
-    for item in grabbed:
-        definition = POWERUP_DEFINITIONS[item.power_type]
-        player.apply_powerup(item.power_type, float(definition["duration"]))
-        session.floating_texts.append(
-            FloatingText(str(definition["label"]), item.position.copy(), tuple(definition["color"]))
-        )
-        session.powerups.remove(item)
+    magnet_center = player_rect.center if player.has_effect("magnet") else None
+    reach_left = player_rect.left - PICKUP_REACH
+    reach_right = player_rect.right + PICKUP_REACH
+    # Off-screen pickups keep their animation phase frozen until they scroll back into view.
+    active_left, _, active_right, _ = visible_bounds(session.camera_offset())
+    # The player is always inside the view, so every crystal within reach is also being updated.
+    for collectible in session.collectibles_between(active_left, active_right):
+        collectible.update(dt, magnet_center)
+        x, y = collectible.position
+        if reach_left <= x <= reach_right and collectible.collides_with(player_rect):
+            session.remove_collectible(collectible)
+            session.base_score += collectible.value
+            session.crystals += 1
+            session.floating_texts.append(
+                FloatingText(f"+{collectible.value}", (x, y - 12), (255, 226, 146))
+            )
+        elif magnet_center is not None:
+            session.rehash_collectible(collectible)
+
+    # Walk backwards so swap-popping a grabbed item only moves one that was already visited.
+    powerups = session.powerups
+    for index in range(len(powerups) - 1, -1, -1):
+        powerup = powerups[index]
+        if active_left <= powerup.position.x <= active_right:
+            powerup.update(dt)
+        if reach_left <= powerup.position.x <= reach_right and powerup.collides_with(player_rect):
+            powerups[index] = powerups[-1]
+            powerups.pop()
+            definition = POWERUP_DEFINITIONS[powerup.power_type]
+            player.apply_powerup(powerup.power_type, definition.duration)
+            session.floating_texts.append(
+                FloatingText(definition.label, tuple(powerup.position), definition.color)
+            )
 
-    for text in list(session.floating_texts):
+    # Compact the live texts to the front in place, keeping their order, then trim the rest.
+    texts = session.floating_texts
+    write = 0
+    for text in texts:
         text.update(dt)
-        if text.elapsed >= text.lifetime:
-            session.floating_texts.remove(text)
+        if text.elapsed < text.lifetime:
+            texts[write] = text
+            write += 1
+    del texts[write:]
 
     expanded_rect = player_rect.inflate(-6, -4)
-    for hazard in session.level.hazards:
-        if hazard.rect.colliderect(expanded_rect):
-            if player.consume_shield():
-                session.floating_texts.append(
-                    FloatingText("Escudo!", pygame.Vector2(player_rect.center), (140, 220, 255))
-                )
-            else:
-                session.result = "Atingido pelos espinhos"
-                return "fail"
+    for _ in expanded_rect.collidelistall(session.level.hazard_rects_in_region(expanded_rect)):
+        if player.consume_shield():
+            session.floating_texts.append(FloatingText("Escudo!", player_rect.center, (140, 220, 255)))
+        else:
+            session.result = "Atingido pelos espinhos"
+            return "fail"
 
     if player.position.y > session.level.pixel_height + 100:
         session.result = "Caiu no abismo"
         return "fail"
 
-    if player.rect.colliderect(session.level.goal_rect):
+    # The player has not moved since player_rect was taken; until they reach the goal column the
+    # integer compare alone rejects the check.
+    goal_rect = session.level.goal_rect
+    if player_rect.right > goal_rect.left and player_rect.colliderect(goal_rect):
         session.result = "Chegou ao portal"
         return "success"
 
@@ -833,10 +1185,13 @@ def run() -> None:
     pygame.init()
     pygame.display.set_caption("Procedural Pixel Platformer")
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Keep mouse, window and controller events out of the queue; the loop only reacts to these.
+    # TEXTINPUT stays allowed because pygame fills in KEYDOWN.unicode from it for name entry.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT])
     clock = pygame.time.Clock()
 
     background = ParallaxBackground((SCREEN_WIDTH, SCREEN_HEIGHT))
-    tile_palette = build_tile_palette()
     spike_surface = build_spike_surface(TILE_SIZE, TILE_SIZE // 2)
     goal_surface = build_goal_surface(TILE_SIZE * 3, TILE_SIZE * 6)
     large_font = pygame.font.Font(None, 52)
@@ -845,6 +1200,7 @@ def run() -> None:
     score_manager = ScoreManager(SCORE_FILE)
     state = GameState(score_manager)
 
+    accumulator = 0.0
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0
@@ -855,23 +1211,17 @@ def run() -> None:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
-                elif state.mode == "title" and event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    state.start_new_session()
-                elif state.mode == "game_over":
-                    if state.awaiting_name:
-                        if event.key == pygame.K_RETURN:
-                            state.finalize_score()
-                        elif event.key == pygame.K_BACKSPACE:
-                            state.name_input = state.name_input[:-1]
-                        elif event.unicode and event.unicode.isprintable():
-                            state.name_input += event.unicode
-                    else:
-                        if event.key in (pygame.K_r, pygame.K_SPACE, pygame.K_RETURN):
-                            state.mode = "title"
-                            state.session = None
-                elif state.mode == "running" and event.key == pygame.K_r:
-                    state.mode = "title"
-                    state.session = None
+                elif state.mode == "game_over" and state.awaiting_name:
+                    if event.key == pygame.K_RETURN:
+                        state.finalize_score()
+                    elif event.key == pygame.K_BACKSPACE:
+                        state.name_input = state.name_input[:-1]
+                    elif event.unicode and event.unicode.isprintable():
+                        state.name_input += event.unicode
+                else:
+                    action = KEY_ACTIONS[state.mode].get(event.key)
+                    if action is not None:
+                        action(state)
 
         screen.fill((18, 20, 32))
 
@@ -880,35 +1230,39 @@ def run() -> None:
             draw_title_screen(screen, large_font, medium_font, score_manager.top_entries())
         elif state.mode == "running" and state.session:
             session = state.session
-            pressed = pygame.key.get_pressed()
-            outcome = update_session(session, dt, pressed)
-            camera_x = max(0, min(session.level.pixel_width - SCREEN_WIDTH, session.player.position.x - SCREEN_WIDTH / 2))
-            camera_y = max(0, min(session.level.pixel_height - SCREEN_HEIGHT, session.player.position.y - SCREEN_HEIGHT / 2))
-            camera_offset = pygame.Vector2(camera_x, camera_y)
-
-            background.draw(screen, camera_x)
-            draw_tiles(screen, session.level, camera_offset, tile_palette)
+            inputs = read_inputs(pygame.key.get_pressed())
+            # Step the simulation at a fixed rate so physics does not depend on how long frames take.
+            accumulator += min(dt, MAX_FRAME_TIME)
+            outcome = None
+            while outcome is None and accumulator >= FIXED_DT:
+                outcome = update_session(session, FIXED_DT, inputs)
+                accumulator -= FIXED_DT
+            # Draw moving things part-way between the last two steps by the time left over.
+            alpha = min(1.0, accumulator / FIXED_DT)
+            camera_offset = session.camera_offset(alpha)
+
+            background.draw(screen, camera_offset.x)
+            draw_tiles(screen, session.level, camera_offset, session.tile_strips)
             draw_hazards(screen, session.level, camera_offset, spike_surface)
             draw_goal(screen, session.level, camera_offset, goal_surface)
-            draw_collectibles(screen, session.collectibles, camera_offset)
+            draw_collectibles(screen, session.collectibles_in_view(camera_offset), camera_offset, alpha)
             draw_powerups(screen, session.powerups, camera_offset)
-            session.player.draw(screen, camera_offset)
-            draw_floating_texts(screen, session.floating_texts, camera_offset, medium_font)
+            session.player.draw(screen, camera_offset, alpha)
+            draw_floating_texts(screen, session.floating_texts, camera_offset, medium_font, alpha)
             draw_hud(screen, session, large_font, medium_font)
 
             if outcome:
                 result_text = session.result or ("Vitória" if outcome == "success" else "")
                 state.finish_session(result_text)
+                accumulator = 0.0
         elif state.mode == "game_over":
             if state.session:
                 session = state.session
-                camera_x = max(0, min(session.level.pixel_width - SCREEN_WIDTH, session.player.position.x - SCREEN_WIDTH / 2))
-                camera_y = max(0, min(session.level.pixel_height - SCREEN_HEIGHT, session.player.position.y - SCREEN_HEIGHT / 2))
-                camera_offset = pygame.Vector2(camera_x, camera_y)
-                background.draw(screen, camera_x)
-                draw_tiles(screen, session.level, camera_offset, tile_palette)
+                camera_offset = session.camera_offset()
+                background.draw(screen, camera_offset.x)
+                draw_tiles(screen, session.level, camera_offset, session.tile_strips)
                 draw_goal(screen, session.level, camera_offset, goal_surface)
-                draw_collectibles(screen, session.collectibles, camera_offset)
+                draw_collectibles(screen, session.collectibles_in_view(camera_offset), camera_offset)
                 draw_powerups(screen, session.powerups, camera_offset)
                 session.player.draw(screen, camera_offset)
             draw_game_over(screen, state, large_font, medium_font)
@@ -921,9 +1275,20 @@ def run() -> None:
 class ParallaxBackground:
     """A layered parallax background made from pixel art gradients."""
 
+    PARALLAX_STRENGTHS = (0.15, 0.25, 0.45, 0.75)
+
     def __init__(self, screen_size: Tuple[int, int]) -> None:
         self.screen_width, self.screen_height = screen_size
-        self.layers = [self._create_layer(i) for i in range(4)]
+        # Layers are drawn back to front, so anything beneath the topmost
+        # full-screen opaque layer is overdrawn. Paint from the front and stop
+        # there so hidden layers are never built.
+        visible = []
+        for index in reversed(range(len(self.PARALLAX_STRENGTHS))):
+            layer = self._create_layer(index)
+            visible.append((self._build_strip(layer), self.PARALLAX_STRENGTHS[index]))
+            if not layer.get_flags() & pygame.SRCALPHA and layer.get_colorkey() is None:
+                break
+        self.visible_layers = tuple(reversed(visible))
 
     def _create_layer(self, index: int) -> pygame.Surface:
         layer = pygame.Surface((self.screen_width, self.screen_height))
@@ -934,15 +1299,14 @@ class ParallaxBackground:
             [(56, 86, 132), (142, 188, 226)],
         ]
         colors = palettes[min(index, len(palettes) - 1)]
-        for y in range(self.screen_height):
-            t = y / self.screen_height
-            color = [int(colors[0][i] * (1 - t) + colors[1][i] * t) for i in range(3)]
-            pygame.draw.line(layer, color, (0, y), (self.screen_width, y))
+        layer.blit(create_vertical_gradient((self.screen_width, self.screen_height), colors[0], colors[1]), (0, 0))
         if index == 0:
-            for n in range(180):
-                x = int((n * 127) % self.screen_width)
-                y = int((n * 53) % (self.screen_height // 2))
-                layer.fill((255, 255, 255), ((x, y), (1, 1)))
+            star_color = layer.map_rgb((255, 255, 255))
+            with pygame.PixelArray(layer) as pixels:
+                for n in range(180):
+                    x = int((n * 127) % self.screen_width)
+                    y = int((n * 53) % (self.screen_height // 2))
+                    pixels[x, y] = star_color
         elif index == 1:
             for n in range(40):
                 base_x = (n * 87) % self.screen_width
@@ -956,13 +1320,17 @@ class ParallaxBackground:
                 pygame.draw.polygon(layer, (28, 36, 58), points)
         return layer
 
+    def _build_strip(self, layer: pygame.Surface) -> pygame.Surface:
+        # Lay the layer out twice side by side so any scroll offset is a single blit of one window.
+        strip = pygame.Surface((self.screen_width * 2, self.screen_height))
+        strip.blits(((layer, (0, 0)), (layer, (self.screen_width, 0))), doreturn=False)
+        return strip.convert()
+
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
-        parallax_strengths = [0.15, 0.25, 0.45, 0.75]
-        for layer, strength in zip(self.layers, parallax_strengths):
-            offset_x = int(camera_x * strength) % self.screen_width
-            surface.blit(layer, (-offset_x, 0))
-            if offset_x > 0:
-                surface.blit(layer, (self.screen_width - offset_x, 0))
+        width = self.screen_width
+        height = self.screen_height
+        for layer, strength in self.visible_layers:
+            surface.blit(layer, (0, 0), (int(camera_x * strength) % width, 0, width, height))
 
 
 if __name__ == "__main__":